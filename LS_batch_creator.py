@@ -6,19 +6,27 @@ import os
 import json
 import time
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import List, Optional, Tuple, Dict
 from getpass import getpass
 from datetime import datetime
 
-import pyperclip
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -42,34 +50,108 @@ class OnlineAssignment:
 
 class GSOnlineCreator:
     base_url = "https://www.gradescope.com"
+    implicit_wait = 5
+    cookie_file = ".gs_cookies.json"
+    cookie_max_age = 12 * 3600
+
+    # Assets the form automation never needs; stylesheets stay so visibility checks hold
+    BLOCKED_URLS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.woff", "*.woff2", "*.ttf",
+        "*google-analytics*", "*googletagmanager*", "*segment.io*", "*sentry.io*",
+    ]
 
     SELECTORS = {
         "btn_create_assignment": ".js-newAssignment",
         "type_button": ".treeSelectorNode",
-        "btn_next": "//button[contains(., 'Next') and not(contains(@class,'disabled'))]",
-        "btn_create": "//button[contains(., 'Create Assignment')]",
+        "btn_next": "Next",
+        "btn_create": "Create Assignment",
+        "btn_save": "Save",
         "fld_title": "assignment[title]",
         "fld_release": "assignment[release_date_string]",
         "fld_due": "assignment[due_date_string]",
         "chk_allow_late": "assignment[allow_late_submissions]",
         "fld_late": "assignment[hard_due_date_string]",
-        "chk_enforce_time": "//input[@name='assignment[enforce_time_limit]' and @type='checkbox']",
+        "chk_enforce_time": "assignment[enforce_time_limit]",
         "fld_time_limit": "assignment[time_limit_in_minutes]",
-        "chk_anon": "//input[@name='assignment[submissions_anonymized]' and @type='checkbox']",
-        "chk_group": "//input[@name='assignment[group_submission]' and @type='checkbox']",
+        "chk_anon": "assignment[submissions_anonymized]",
+        "chk_group": "assignment[group_submission]",
         "fld_group_size": "assignment[group_size]",
+        "fld_problem": "textarea[placeholder='Type your problem here']",
+        "btn_add_rubric": 'button[aria-label*="Add Rubric Item"]',
+        "rubric_description": ".rubricField-description",
     }
 
+    # Sets a value through the prototype setter so React sees the change (textContent for
+    # elements without one); focus()/blur() fire real focusout events for React 17+ onBlur
+    SET_VALUE_JS = """
+        function setValue(e, value) {
+            e.focus();
+            const prop = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(e), 'value');
+            if (prop && prop.set) prop.set.call(e, value); else e.textContent = value;
+            e.dispatchEvent(new Event('input', {bubbles: true}));
+            e.dispatchEvent(new Event('change', {bubbles: true}));
+            e.blur();
+        }
+    """
+
+    FILL_JS = SET_VALUE_JS + """
+        const [fields] = arguments;
+        const missing = [];
+        for (const [sel, val] of Object.entries(fields)) {
+            const e = document.querySelector(sel);
+            if (!e) { missing.push(sel); continue; }
+            setValue(e, val);
+        }
+        return missing;
+    """
+
+    # First visible, enabled button whose text contains arguments[0]
+    FIND_BUTTON_JS = """
+        const [text] = arguments;
+        for (const b of document.querySelectorAll('button')) {
+            if (b.textContent.includes(text) && !b.disabled
+                    && !b.classList.contains('disabled') && b.offsetParent !== null) {
+                return b;
+            }
+        }
+        return null;
+    """
+
+    # Click only the checkboxes whose state differs from the wanted one
+    TOGGLE_JS = """
+        const [targets] = arguments;
+        const missing = [];
+        for (const [name, want] of Object.entries(targets)) {
+            const c = document.querySelector(`input[type='checkbox'][name='${name}']`);
+            if (!c) { missing.push(name); continue; }
+            if (c.checked !== want) c.click();
+        }
+        return missing;
+    """
+
+    REACT_SET_JS = SET_VALUE_JS + """
+        setValue(arguments[0], arguments[1]);
+    """
+
     def __init__(self, email: str, password: str, course_url: str, headless: bool = False):
         self.email = email
         self.password = password
         self.course_url = course_url.rstrip('/')
         self.driver = None
         self.wait: Optional[WebDriverWait] = None
+        self.debugger_address: Optional[str] = None
+        self._tab = threading.local()
+        self.session_restored = False
+        self._routing = False
 
         opts = ChromeOptions()
         if headless:
+            # Nothing is asserted visually, so skip GPU work and image decoding
             opts.add_argument('--headless=new')
+            opts.add_argument('--disable-gpu')
+            opts.add_argument('--disable-extensions')
+            opts.add_argument('--blink-settings=imagesEnabled=false')
+            opts.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
         opts.add_argument('--no-sandbox')
         opts.add_argument('--disable-dev-shm-usage')
         opts.add_argument('--disable-blink-features=AutomationControlled')
@@ -78,15 +160,63 @@ class GSOnlineCreator:
         opts.add_argument('--window-size=1920,1080')
         self.chrome_options = opts
 
-    def start(self):
-        self.driver = webdriver.Chrome(options=self.chrome_options)
-        self.driver.maximize_window()
+    def start(self, debugger_address: Optional[str] = None):
+        self.debugger_address = debugger_address
+        if debugger_address:
+            # Attach to a Chrome launched with --remote-debugging-port instead of spawning one
+            opts = ChromeOptions()
+            opts.debugger_address = debugger_address
+            self.driver = webdriver.Chrome(options=opts)
+        else:
+            self.driver = webdriver.Chrome(options=self.chrome_options)
+            self.driver.maximize_window()
+        self._block_assets()
+        self.driver.implicitly_wait(self.implicit_wait)
         self.wait = WebDriverWait(self.driver, 20)
         logger.info("WebDriver started")
+        self.session_restored = self._restore_cookies()
+
+    def _block_assets(self):
+        # CDP network settings are per target, so every new tab needs this too
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URLS})
+
+    def _save_cookies(self):
+        try:
+            fd = os.open(self.cookie_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.driver.get_cookies(), f)
+        except OSError as e:
+            logger.warning(f"Could not save session cookies: {e}")
+
+    def _restore_cookies(self) -> bool:
+        try:
+            if time.time() - os.path.getmtime(self.cookie_file) > self.cookie_max_age:
+                return False
+            with open(self.cookie_file, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        self.driver.get(self.base_url)
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception as e:
+                logger.debug(f"Skipping cookie {cookie.get('name')}: {e}")
+        return True
+
+    def ensure_logged_in(self) -> bool:
+        """Open the assignments page, logging in first unless saved cookies are still accepted."""
+        if self.session_restored and self.goto_assignments():
+            logger.info("Reused saved session")
+            return True
+        return self.login() and self.goto_assignments()
 
     def stop(self):
         if self.driver:
             self.driver.quit()
+            self.driver = None
             logger.info("WebDriver closed")
 
     def login(self) -> bool:
@@ -98,6 +228,8 @@ class GSOnlineCreator:
             time.sleep(3)
             success = "login" not in self.driver.current_url
             logger.info("Login successful" if success else "Login failed")
+            if success:
+                self._save_cookies()
             return success
         except Exception as e:
             logger.error(f"Login exception: {e}")
@@ -106,21 +238,53 @@ class GSOnlineCreator:
     def goto_assignments(self) -> bool:
         try:
             self.driver.get(f"{self.course_url}/assignments")
-            time.sleep(1.5)
-            return True
+            if "login" in self.driver.current_url:
+                return False  # session rejected, the list will never render
+            # get() returns at load; wait for the client-rendered list to become usable
+            return self._wait_for_list()
         except:
             return False
 
-    def _ensure_element_visible(self, element) -> bool:
+    def _wait_for_list(self, timeout: float = 10) -> bool:
         try:
-            self.driver.execute_script("""
-                arguments[0].scrollIntoView({block: 'center'});
-            """, element)
-            time.sleep(0.2)
+            WebDriverWait(self.driver, timeout).until(lambda d: d.execute_script(
+                "return document.querySelector(arguments[0]) !== null", self.SELECTORS["btn_create_assignment"]))
             return True
-        except:
+        except TimeoutException:
             return False
 
+    @contextmanager
+    def _no_implicit_wait(self):
+        if self._routing:
+            # Already 0 session-wide; toggling would affect the other tabs' lookups
+            yield
+            return
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self.implicit_wait)
+
+    def _wait_clickable(self, locator: Tuple[str, str], timeout: float = 10):
+        return WebDriverWait(self.driver, timeout).until(EC.element_to_be_clickable(locator))
+
+    def _find_button_by_text(self, text: str) -> Optional[WebElement]:
+        return self.driver.execute_script(self.FIND_BUTTON_JS, text)
+
+    def _wait_button(self, text: str, timeout: float = 20) -> WebElement:
+        return WebDriverWait(self.driver, timeout).until(lambda _: self._find_button_by_text(text))
+
+    def _click_and_wait_for(self, element: WebElement, condition, timeout: float = 20):
+        """Click ``element`` and wait for ``condition``, the next page's landmark; returns its result."""
+        element.click()
+        return WebDriverWait(self.driver, timeout).until(condition)
+
+    def _wait_present(self, locator: Tuple[str, str], timeout: float = 10):
+        return WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located(locator))
+
+    def _react_set(self, element: WebElement, value: str):
+        self.driver.execute_script(self.REACT_SET_JS, element, value)
+
     def _parse_24h_to_datetime(self, date_str: str) -> Optional[datetime]:
         for fmt in ('%Y-%m-%d %H:%M', '%Y/%m/%d %H:%M', '%Y-%m-%dT%H:%M'):
             try:
@@ -129,105 +293,127 @@ class GSOnlineCreator:
                 continue
         return None
 
-    def _set_datetime_field(self, field_name: str, date_str: str) -> bool:
+    def _fill_fields(self, fields: Dict[str, str]) -> List[str]:
+        """Set ``fields`` (keyed by CSS selector) in one call; returns the selectors that matched nothing."""
+        return self.driver.execute_script(self.FILL_JS, fields)
+
+    def _format_datetime(self, date_str: str) -> Optional[str]:
         dt = self._parse_24h_to_datetime(date_str)
-        if not dt:
-            return False
-        
-        human_format = dt.strftime('%Y-%m-%d %H:%M')
-        
-        element = self.wait.until(EC.presence_of_element_located((By.NAME, field_name)))
-        self._ensure_element_visible(element)
-        
-        pyperclip.copy(human_format)
-        element.click()
-        element.send_keys(Keys.CONTROL + "a")
-        element.send_keys(Keys.CONTROL + "v")
-        element.send_keys(Keys.TAB)
-        time.sleep(0.3)
-        return True
+        return dt.strftime('%Y-%m-%d %H:%M') if dt else None
 
     def _fill_create_form(self, a: OnlineAssignment):
         d, S = self.driver, self.SELECTORS
         
-        title_elem = self.wait.until(EC.presence_of_element_located((By.NAME, S["fld_title"])))
-        title_elem.clear()
-        title_elem.send_keys(a.name)
-        
-        self._set_datetime_field(S["fld_release"], a.release_date)
-        self._set_datetime_field(S["fld_due"], a.due_date)
-        time.sleep(0.5)
+        # Options left as None keep the form default
+        options = {
+            "chk_allow_late": a.late_due_date,
+            "chk_enforce_time": a.enforce_time_limit,
+            "chk_anon": a.anonymous_grading,
+            "chk_group": a.group_submission,
+        }
+        targets = {S[k]: bool(v) for k, v in options.items() if v is not None}
         
+        values = {
+            "fld_title": a.name,
+            "fld_release": self._format_datetime(a.release_date),
+            "fld_due": self._format_datetime(a.due_date),
+        }
         if a.late_due_date:
-            try:
-                chk = d.find_element(By.NAME, S["chk_allow_late"])
-                if not chk.is_selected():
-                    chk.click()
-                    time.sleep(0.3)
-                self._set_datetime_field(S["fld_late"], a.late_due_date)
-            except:
-                pass
-        
-        if a.enforce_time_limit:
-            try:
-                chk = d.find_element(By.XPATH, S["chk_enforce_time"])
-                if not chk.is_selected():
-                    chk.click()
-                    time.sleep(0.3)
-                if a.time_limit:
-                    tl_elem = d.find_element(By.NAME, S["fld_time_limit"])
-                    tl_elem.clear()
-                    tl_elem.send_keys(str(a.time_limit))
-            except:
-                pass
+            values["fld_late"] = self._format_datetime(a.late_due_date)
+        if a.enforce_time_limit and a.time_limit:
+            values["fld_time_limit"] = str(a.time_limit)
+        if a.group_submission and a.group_size:
+            values["fld_group_size"] = str(a.group_size)
+        values = {k: v for k, v in values.items() if v is not None}
+        dependent = [k for k in ("fld_late", "fld_time_limit", "fld_group_size") if k in values]
         
-        if a.anonymous_grading:
-            try:
-                chk = d.find_element(By.XPATH, S["chk_anon"])
-                if not chk.is_selected():
-                    chk.click()
-            except:
-                pass
+        for name in d.execute_script(self.TOGGLE_JS, targets):
+            logger.warning(f"Checkbox not found: {name}")
         
-        if a.group_submission:
+        if dependent:
             try:
-                chk = d.find_element(By.XPATH, S["chk_group"])
-                if not chk.is_selected():
-                    chk.click()
-                    time.sleep(0.3)
-                if a.group_size:
-                    gs_elem = d.find_element(By.NAME, S["fld_group_size"])
-                    gs_elem.clear()
-                    gs_elem.send_keys(str(a.group_size))
-            except:
-                pass
+                self.wait.until(EC.all_of(*[
+                    EC.visibility_of_element_located((By.NAME, S[k])) for k in dependent
+                ]))
+            except TimeoutException:
+                logger.warning("Dependent form fields did not appear")
         
-        time.sleep(0.5)
+        missing = self._fill_fields({f'[name="{S[k]}"]': v for k, v in values.items()})
+        if missing:
+            logger.warning(f"Form fields not found: {', '.join(missing)}")
 
     def _fill_outline_page(self, a: OnlineAssignment):
-        time.sleep(2)
-        
         try:
+            fields = {
+                "input[placeholder='0.0']": str(a.total_points),
+                self.SELECTORS["fld_problem"]: "\n\n|____|",
+            }
             if a.question_text:
-                title = self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Title']")
-                title.clear()
-                title.send_keys(a.question_text)
-            
-            points = self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='0.0']")
-            points.clear()
-            points.send_keys(str(a.total_points))
+                fields["input[placeholder='Title']"] = a.question_text
             
-            problem = self.driver.find_element(By.CSS_SELECTOR, "textarea[placeholder='Type your problem here']")
-            problem.clear()
-            problem.send_keys("\n\n|____|")
+            missing = self._fill_fields(fields)
+            if missing:
+                logger.warning(f"Outline fields not found: {', '.join(missing)}")
             
-            time.sleep(1)
-            save_btn = self.driver.find_element(By.XPATH, "//button[contains(text(),'Save') and not(contains(@class,'disabled'))]")
+            save_btn = self._wait_button(self.SELECTORS["btn_save"], timeout=10)
+            url = self.driver.current_url
             save_btn.click()
-            time.sleep(2)
+            self.wait.until(EC.any_of(EC.url_changes(url), EC.invisibility_of_element(save_btn)))
         except Exception as e:
             logger.warning(f"Outline page filling issue: {e}")
 
+    def _with_fresh_element(self, locator_fn, action_fn, retries: int = 3) -> Optional[WebElement]:
+        """Run ``action_fn`` on ``locator_fn()``, re-locating if the element goes stale.
+
+        Returns the element acted on, or None if ``locator_fn`` found nothing.
+        """
+        for attempt in range(retries):
+            try:
+                element = locator_fn()
+                if element is not None:
+                    action_fn(element)
+                return element
+            except StaleElementReferenceException:
+                if attempt == retries - 1:
+                    raise
+                logger.debug(f"Stale element, retrying ({attempt + 1}/{retries})")
+
+    def _last_rubric_item(self) -> WebElement:
+        return self.driver.find_elements(By.CLASS_NAME, "rubricItem")[-1]
+
+    def _rubric_description_field(self, rubric_item: WebElement,
+                                  exact_text: Optional[str] = None) -> Optional[WebElement]:
+        """Description field of ``rubric_item``; if the selector misses, fall back to a <p>
+        whose text is ``exact_text`` when given, else to a short placeholder-like <p>."""
+        with self._no_implicit_wait():
+            fields = rubric_item.find_elements(By.CSS_SELECTOR, self.SELECTORS["rubric_description"])
+        if fields:
+            return fields[0]
+        p_elements = rubric_item.find_elements(By.TAG_NAME, "p")
+        if exact_text is not None:
+            return next((p for p in p_elements if p.text.strip() == exact_text), None)
+        for p in p_elements:
+            text = p.text.strip()
+            if text in ["Correct", "Incorrect", ""] or len(text) < 20:
+                return p
+        return p_elements[0] if p_elements else None
+
+    def _edit_rubric_field(self, value: str):
+        """Fill the inline editor a rubric click just opened and wait for it to close."""
+        editor = WebDriverWait(self.driver, 5).until(lambda d: d.execute_script(
+            "const e = document.activeElement;"
+            " return e && (e.matches('input, textarea') || e.isContentEditable) ? e : null;"))
+        self._react_set(editor, value)
+        try:
+            WebDriverWait(self.driver, 2).until(EC.invisibility_of_element(editor))
+        except TimeoutException:
+            logger.debug("Rubric editor stayed open after commit")
+
+    def _add_rubric_button(self) -> Optional[WebElement]:
+        with self._no_implicit_wait():
+            found = self.driver.find_elements(By.CSS_SELECTOR, self.SELECTORS["btn_add_rubric"])
+        return found[0] if found else self._find_button_by_text("Add Rubric Item")
+
     def _setup_rubric(self, rubric_data: Dict[str, float]):
         try:
             current_url = self.driver.current_url
@@ -238,7 +424,7 @@ class GSOnlineCreator:
                 rubric_url = f"{self.course_url}/assignments/{assignment_id}/rubric/edit"
                 
                 self.driver.get(rubric_url)
-                time.sleep(3)
+                self._wait_present((By.CLASS_NAME, "rubricItem"))
                 
                 rubric_items = []
                 for description, points in rubric_data.items():
@@ -250,30 +436,17 @@ class GSOnlineCreator:
                 for i, item in enumerate(rubric_items):                  
                     if i == 0:
                         try:
-                            p_elements = self.driver.find_elements(By.TAG_NAME, "p")
-                            for p in p_elements:
-                                if p.text.strip() == "Correct":
-                                    pyperclip.copy(item['description'])
-                                    p.click()
-                                    time.sleep(0.5)
-                                    
-                                    active = self.driver.switch_to.active_element
-                                    active.send_keys(Keys.CONTROL + "a")
-                                    active.send_keys(Keys.CONTROL + "v")
-                                    active.send_keys(Keys.TAB)
-                                    time.sleep(0.5)
-                                    break
-                            
-                            pyperclip.copy(str(item['points']))
-                            points_btn = self.driver.find_element(By.CSS_SELECTOR, ".rubricField-points")
-                            points_btn.click()
-                            time.sleep(0.5)
+                            first = self._with_fresh_element(
+                                lambda: self._rubric_description_field(
+                                    self.driver.find_element(By.CLASS_NAME, "rubricItem"), exact_text="Correct"),
+                                lambda p: p.click())
+                            if first:
+                                self._edit_rubric_field(item['description'])
                             
-                            active = self.driver.switch_to.active_element
-                            active.send_keys(Keys.CONTROL + "a")
-                            active.send_keys(Keys.CONTROL + "v")
-                            active.send_keys(Keys.TAB)
-                            time.sleep(0.5)
+                            self._with_fresh_element(
+                                lambda: self.driver.find_element(By.CSS_SELECTOR, ".rubricField-points"),
+                                lambda btn: btn.click())
+                            self._edit_rubric_field(str(item['points']))
                             
                         except Exception as e:
                             logger.warning(f"Error updating first rubric item: {e}")
@@ -281,61 +454,27 @@ class GSOnlineCreator:
                     else:
                         # Add new rubric item
                         try:
-                            # Find and click Add Rubric Item button
-                            buttons = self.driver.find_elements(By.TAG_NAME, "button")
-                            for btn in buttons:
-                                aria_label = btn.get_attribute('aria-label') or ''
-                                btn_text = btn.text or ''
-                                if 'Add Rubric Item' in aria_label or 'Add Rubric Item' in btn_text:
-                                    btn.click()
-                                    break
+                            count = len(self.driver.find_elements(By.CLASS_NAME, "rubricItem"))
+                            
+                            self._with_fresh_element(self._add_rubric_button, lambda btn: btn.click())
+                            
+                            # Wait for the new item to render rather than a fixed delay
+                            self.wait.until(lambda d: len(d.find_elements(By.CLASS_NAME, "rubricItem")) > count)
+                            
+                            if self._with_fresh_element(
+                                    lambda: self._rubric_description_field(self._last_rubric_item()),
+                                    lambda p: p.click()):
+                                self._edit_rubric_field(item['description'])
                             
-                            time.sleep(2)
+                            def points_field():
+                                points_btns = self._last_rubric_item().find_elements(By.CSS_SELECTOR, ".rubricField-points")
+                                return points_btns[0] if points_btns else None
                             
-                            rubric_items_elements = self.driver.find_elements(By.CLASS_NAME, "rubricItem")
-                            if rubric_items_elements and len(rubric_items_elements) > i:
-                                last_item = rubric_items_elements[-1]
-                                
-                                p_elements = last_item.find_elements(By.TAG_NAME, "p")
-                                clicked = False
-                                for p in p_elements:
-                                    text = p.text.strip()
-                                    if text in ["Correct", "Incorrect", ""] or len(text) < 20:
-                                        pyperclip.copy(item['description'])
-                                        p.click()
-                                        clicked = True
-                                        break
-                                
-                                if not clicked and p_elements:
-                                    pyperclip.copy(item['description'])
-                                    p_elements[0].click()
-                                
-                                time.sleep(0.5)
-                                active = self.driver.switch_to.active_element
-                                active.send_keys(Keys.CONTROL + "a")
-                                active.send_keys(Keys.CONTROL + "v")
-                                active.send_keys(Keys.TAB)
-                                time.sleep(0.5)
-                                
-                                rubric_items_elements = self.driver.find_elements(By.CLASS_NAME, "rubricItem")
-                                if rubric_items_elements and len(rubric_items_elements) > i:
-                                    last_item = rubric_items_elements[-1]
-                                    points_btns = last_item.find_elements(By.CSS_SELECTOR, ".rubricField-points")
-                                    if points_btns:
-                                        pyperclip.copy(str(item['points']))
-                                        points_btns[0].click()
-                                        time.sleep(0.5)
-                                        
-                                        active = self.driver.switch_to.active_element
-                                        active.send_keys(Keys.CONTROL + "a")
-                                        active.send_keys(Keys.CONTROL + "v")
-                                        active.send_keys(Keys.TAB)
-                                        time.sleep(0.5)
+                            if self._with_fresh_element(points_field, lambda btn: btn.click()):
+                                self._edit_rubric_field(str(item['points']))
                                     
                         except Exception as e:
                             logger.warning(f"Error adding rubric item {i+1}: {e}")
-                    
-                    time.sleep(1)
                 
         except Exception as e:
             logger.warning(f"Rubric setup issue: {e}")
@@ -346,28 +485,29 @@ class GSOnlineCreator:
         try:
             logger.info(f"Creating: {a.name}")
             
-            create_btn = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, S["btn_create_assignment"])))
-            create_btn.click()
-            time.sleep(1)
+            # Each click waits on the landmark of the page it leads to, not the button again
+            self._click_and_wait_for(
+                self._wait_clickable((By.CSS_SELECTOR, S["btn_create_assignment"]), timeout=20),
+                EC.presence_of_element_located((By.CSS_SELECTOR, S["type_button"])))
             
             for btn in d.find_elements(By.CSS_SELECTOR, S["type_button"]):
                 if 'Online Assignment' in (btn.text or ''):
                     btn.click()
                     break
             
-            next_btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, S["btn_next"])))
-            next_btn.click()
-            time.sleep(1.5)
+            self._click_and_wait_for(
+                self._wait_button(S["btn_next"]),
+                EC.presence_of_element_located((By.NAME, S["fld_title"])))
             
             self._fill_create_form(a)
             
-            next_btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, S["btn_next"])))
-            next_btn.click()
-            time.sleep(2)
+            create_btn = self._click_and_wait_for(
+                self._wait_button(S["btn_next"]),
+                lambda _: self._find_button_by_text(S["btn_create"]))
             
-            create_btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, S["btn_create"])))
-            create_btn.click()
-            time.sleep(3)
+            self._click_and_wait_for(
+                create_btn,
+                EC.presence_of_element_located((By.CSS_SELECTOR, S["fld_problem"])))
             
             self._fill_outline_page(a)
             
@@ -384,7 +524,93 @@ class GSOnlineCreator:
             self.goto_assignments()
             return False
 
-    def batch_create(self, assignments: List[OnlineAssignment]) -> Tuple[int, List[str]]:
+    @contextmanager
+    def _tab_routing(self):
+        """Route every WebDriver command to the calling thread's tab while active.
+
+        All commands (including WebElement ones) pass through ``driver.execute``,
+        so switching there keeps each worker on its own window. The implicit wait
+        is session-wide and would hold the lock through every missed lookup, so it
+        is set to 0 here and the flow relies on its explicit waits.
+        """
+        d = self.driver
+        execute = d.execute
+        lock = threading.RLock()
+        current = {"handle": d.current_window_handle}
+
+        def routed(command, params=None):
+            handle = getattr(self._tab, "handle", None)
+            with lock:
+                if command == Command.SWITCH_TO_WINDOW:
+                    current["handle"] = params["handle"]
+                elif handle and handle != current["handle"]:
+                    execute(Command.SWITCH_TO_WINDOW, {"handle": handle})
+                    current["handle"] = handle
+                return execute(command, params)
+
+        d.implicitly_wait(0)
+        d.execute = routed
+        self._routing = True
+        try:
+            yield
+        finally:
+            self._routing = False
+            del d.execute
+            d.implicitly_wait(self.implicit_wait)
+
+    @staticmethod
+    def _estimated_cost(a: OnlineAssignment) -> float:
+        return (1 + 3 * bool(a.rubric) + 0.5 * len(a.rubric or {})
+                + bool(a.group_submission) + bool(a.enforce_time_limit))
+
+    def _batch_create_tabs(self, assignments: List[OnlineAssignment], workers: int) -> List[str]:
+        d = self.driver
+        main_handle = d.current_window_handle
+        handles = [main_handle]
+        
+        def run(job):
+            i, assignment = job
+            handle = free.get()
+            self._tab.handle = handle
+            try:
+                logger.info(f"[{i}/{len(assignments)}] {assignment.name}")
+                return self.create(assignment)
+            finally:
+                free.put(handle)
+        
+        # Longest jobs first so a big rubric does not start last and set the makespan
+        jobs = sorted(enumerate(assignments, 1), key=lambda job: self._estimated_cost(job[1]), reverse=True)
+        try:
+            for _ in range(min(workers, len(assignments)) - 1):
+                d.switch_to.new_window('tab')
+                self._block_assets()
+                # A tab whose list never renders would fail every job sent to it
+                if self.goto_assignments() or self.goto_assignments():
+                    handles.append(d.current_window_handle)
+                else:
+                    logger.warning("Worker tab could not open assignments, closing it")
+                    d.close()
+                    d.switch_to.window(main_handle)
+            
+            free = queue.Queue()
+            for handle in handles:
+                free.put(handle)
+            
+            with self._tab_routing(), ThreadPoolExecutor(max_workers=len(handles)) as pool:
+                results = list(pool.map(run, jobs))
+            # Report failures in input order, not the order they ran in
+            return [a.name for (_, a), ok in sorted(zip(jobs, results), key=lambda r: r[0][0]) if not ok]
+        finally:
+            for handle in handles[1:]:
+                d.switch_to.window(handle)
+                d.close()
+            d.switch_to.window(main_handle)
+
+    def batch_create(self, assignments: List[OnlineAssignment], workers: int = 1) -> Tuple[int, List[str]]:
+        if workers > 1 and len(assignments) > 1:
+            failed_names = self._batch_create_tabs(assignments, workers)
+            return len(assignments) - len(failed_names), failed_names
+        
         success_count = 0
         failed_names = []
         
@@ -403,8 +629,9 @@ class GSOnlineCreator:
 
     @staticmethod
     def load_from_json(path: str) -> List[OnlineAssignment]:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         
         assignments = []
         for item in data:
@@ -434,21 +661,19 @@ def main():
     course_url = os.getenv("GS_COURSE_URL") or input("Course URL (e.g., https://www.gradescope.com/courses/xxxxxx): ").strip()
     json_file = os.getenv("GS_JSON") or input("JSON file name: ")
     
-    bot = GSOnlineCreator(email, password, course_url, headless=False)
+    headless = os.getenv("GS_HEADLESS", "1").lower() not in ("0", "false", "no")
+    
+    bot = GSOnlineCreator(email, password, course_url, headless=headless)
     
     try:
-        bot.start()
-        
-        if not bot.login():
-            print("Login failed")
-            return
+        bot.start(os.getenv("GS_DEBUGGER_ADDRESS"))
         
-        if not bot.goto_assignments():
-            print("Cannot access assignments")
+        if not bot.ensure_logged_in():
+            print("Login failed or cannot access assignments")
             return
         
         assignments = bot.load_from_json(json_file)
-        success, failed = bot.batch_create(assignments)
+        success, failed = bot.batch_create(assignments, workers=int(os.getenv("GS_WORKERS", "1")))
         
         print(f"Complete: {success} successful")
         if failed: